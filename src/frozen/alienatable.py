@@ -26,6 +26,20 @@ class AlienError(PermissionError):
 	pass
 
 
+@functools.lru_cache()
+def _alien_error_message(calling_cls: type | None, method: Callable) -> str:
+	"""
+	Formats the error message of calling an alien method. Cached, since the message only depends on its arguments.\n
+	:param calling_cls: The class that called the method.
+	:param method: The called method.
+	:return: The error message.
+	"""
+	return Errors.CallingAlienMethod.format(
+		None if calling_cls is None else calling_cls.__qualname__,
+		method.__qualname__
+	)
+
+
 class Alienatable(ClassWrapperBase['AlienatableClassDecoratorData']):
 	def __load__(self, locks: Iterable[str] = None) -> None:
 		pass
@@ -36,10 +50,7 @@ class Alienatable(ClassWrapperBase['AlienatableClassDecoratorData']):
 		:param method: The frozen method that was called.
 		:raises FrozenError: Always raises an error.
 		"""
-		raise AlienError(Errors.CallingAlienMethod.format(
-				None if calling_cls is None else calling_cls.__qualname__,
-				method.__qualname__
-		))
+		raise AlienError(_alien_error_message(calling_cls, method))
 
 
 class AlienatableClassDecorator(ClassDecorator['AlienatableClassDecorator', 'AlienatableMethodDecorator']):
@@ -52,7 +63,7 @@ class AlienatableClassDecorator(ClassDecorator['AlienatableClassDecorator', 'Ali
 			friends = {None: friends}.items()
 
 		friends = dict((k, frozenset(v)) for k, v in friends)
-		self.friends: DefaultDict = defaultdict(lambda: frozenset(), friends)
+		self.friends: Dict[str | None, FrozenSet[type]] = friends
 
 	def __call__(self, cls, *_):
 		super().__call__(cls)
@@ -60,20 +71,12 @@ class AlienatableClassDecorator(ClassDecorator['AlienatableClassDecorator', 'Ali
 		class AlienatableWrapper(cls, Alienatable):
 			__decorator__ = AlienatableClassDecoratorData(self, cls)
 
-			def __init__(*args, **kwargs):
-				Alienatable.__init__(
-					self=args[0],
-					args=args[1:],
-					kwargs=kwargs,
-					wrapper_cls=AlienatableWrapper,
-				)
-
 		super().__call__(cls, AlienatableWrapper)
 		return AlienatableWrapper
 
 
 class AlienatableClassDecoratorData(ClassDecoratorData):
-	friends: DefaultDict[str, Optional[Set[type]]]
+	friends: Dict[str | None, FrozenSet[type]]
 
 	def __init__(
 			self,
@@ -85,16 +88,13 @@ class AlienatableClassDecoratorData(ClassDecoratorData):
 		:param decorator: The class decorator.
 		:param cls: The decorated class.
 		"""
-		self.friends = decorator.friends
+		self.friends = dict(decorator.friends)
 
 		if issubclass(cls, Alienatable):
 			wrapper = AlienatableClassDecorator.get_wrapper_class(cls)
 
 			for key, cls_set in wrapper.__decorator__.friends.items():
-				if self.friends[key] is None:
-					self.friends[key] = cls_set
-				else:
-					self.friends[key].update(cls_set)
+				self.friends[key] = self.friends.get(key, frozenset()) | cls_set
 
 
 class AlienatableMethodDecorator(MethodDecorator['AlienatableClassDecorator', 'AlienatableMethodDecorator']):
@@ -108,19 +108,23 @@ class AlienatableMethodDecorator(MethodDecorator['AlienatableClassDecorator', 'A
 
 	@functools.lru_cache()
 	def get_valid_classes(self, cls):
+		if not issubclass(cls, (Alienatable, View)):  # Resolved once per class, instead of on every call
+			return None
+
 		wrapper = AlienatableClassDecorator.get_wrapper_class(cls)
-		friends = wrapper.__decorator__.friends if wrapper is not None else set()
-		allowed_classes = set().union(*(friends[key] for key in self.friend_list | {None}))
+		friends = wrapper.__decorator__.friends if wrapper is not None else {}
+		allowed_classes = frozenset().union(*(friends.get(key, ()) for key in self.friend_list | {None}))
 		return allowed_classes
 
 	def __call__(self, method: Callable, *_):
-		super().__call__(method)
+		get_valid_classes = self.get_valid_classes  # Bound once, instead of on every call
 
 		def alienatable_wrapper(*args, **kwargs):
 			obj = args[0]
 
-			if isinstance(obj, Alienatable) or isinstance(obj, View):
-				allowed_classes = self.get_valid_classes(type(obj))
+			allowed_classes = get_valid_classes(type(obj))
+
+			if allowed_classes is not None:
 				found, calling_class = is_calling_class_valid(allowed_classes, from_frame=1)
 
 				if found:
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import sys
 import inspect
 import itertools
 import functools
 from types import *
 from typing import *
 from collections import deque, defaultdict
-from weakref import ref
+from weakref import ref, WeakValueDictionary
 
 
 class Errors:
@@ -112,24 +113,31 @@ class ExecutionTracer:
 
 				return None, None
 
+			mtd_name = code.co_name
+
 			for loc in search_in:
 				if loc not in visited:
 					visited.add(loc)
 
-					for mtd_name, mtd in get_members(loc, superficial):  # Get all methods and functions of loc
-						if isinstance(mtd, (MethodType, FunctionType)) and code.co_name == mtd_name:
-							if code == mtd.__code__:  # If code equals the method's __code__ then the method is found
-								return mtd, loc
-							else:  # If they are not equal, we'll also search in the closure, which is useful when methods are decorated
-								cell_method, cell_loc = search_closure(mtd.__closure__)
+					# Only the member named after the code can be its method; no need to list all members of loc
+					if superficial and mtd_name not in loc.__dict__:
+						continue
+
+					mtd = getattr(loc, mtd_name, None)
 
-								if (cell_method, cell_loc) != (None, None):
-									return cell_method, cell_loc
-								else:  # Also, for static methods, if the code and function names are the same, we also search all subclasses
-									sub_method, sub_loc = search_locations(loc.__subclasses__(), superficial=True)
+					if isinstance(mtd, (MethodType, FunctionType)):
+						if code == mtd.__code__:  # If code equals the method's __code__ then the method is found
+							return mtd, loc
+						else:  # If they are not equal, we'll also search in the closure, which is useful when methods are decorated
+							cell_method, cell_loc = search_closure(mtd.__closure__)
 
-									if (sub_method, sub_loc) != (None, None):
-										return sub_method, sub_loc
+							if (cell_method, cell_loc) != (None, None):
+								return cell_method, cell_loc
+							else:  # Also, for static methods, if the code and function names are the same, we also search all subclasses
+								sub_method, sub_loc = search_locations(loc.__subclasses__(), superficial=True)
+
+								if (sub_method, sub_loc) != (None, None):
+									return sub_method, sub_loc
 
 			return None, None
 
@@ -184,44 +192,134 @@ class ExecutionTracer:
 		else:
 			ExecutionTracer.code_location_cache[id(code)] = ref(location)
 
+	@staticmethod
+	def _get_frame_info(frame: FrameType, location_hint: Iterable[Type] | None = None):
+		"""
+		Given a frame, returns the (method, class) that its code belongs to, from the cache if possible.
+		:return: (method, class) tuple
+		"""
+		try:
+			return ExecutionTracer._get_code_info_from_cache(frame.f_code)
+		except KeyError:
+			method, location = ExecutionTracer._get_code_info(frame, location_hint)
+			ExecutionTracer._update_code_info_cache(frame.f_code, method, location)
+			return method, location
+
+	def first(
+			self,
+			location_hint: Iterable[Type] | None = None,
+			skip_frames: int = 1
+	):
+		"""
+		Returns the (method, class) of a single frame, without creating a generator to walk the stack.
+		The frames are counted as in `__call__`.
+		"""
+		return ExecutionTracer._get_frame_info(sys._getframe(skip_frames), location_hint)  # Frame 0 is this method's
+
 	def __call__(
 			self,
 			location_hint: Iterable[Type] | None = None,
 			skip_frames: int = 1
 	):
-		frame = inspect.currentframe()
+		frame = sys._getframe(skip_frames)  # Frame 0 is the frame of this generator
 
-		for i in range(skip_frames):
+		while frame:
+			yield ExecutionTracer._get_frame_info(frame, location_hint)
 			frame = frame.f_back
 
-		while frame:
-			try:
-				method, location = ExecutionTracer._get_code_info_from_cache(frame.f_code)
-			except KeyError:
-				method, location = ExecutionTracer._get_code_info(frame, location_hint)
-				ExecutionTracer._update_code_info_cache(frame.f_code, method, location)
 
-			yield method, location
-			frame = frame.f_back
+@functools.lru_cache()
+def _is_mro_subclass_of_any(cls: type, classes: FrozenSet[type]) -> bool:
+	"""
+	Checks if any of `classes` is in the MRO of `cls`.
+	Cached, since permissions are checked repeatedly for the same calling classes,
+	and the MRO of a class never changes.\n
+	:param cls: The class to check.
+	:param classes: The candidate base classes.
+	:return: `True` if `cls` is an ordinary subclass of one of `classes`.
+	"""
+	return not classes.isdisjoint(cls.__mro__)
+
+
+def _is_subclass_of_any(cls: type, classes: FrozenSet[type]) -> bool:
+	"""
+	Checks if `cls` is a subclass of any of `classes`.\n
+	:param cls: The class to check.
+	:param classes: The candidate base classes.
+	:return: `True` if `cls` is a subclass of one of `classes`.
+	"""
+	# `issubclass` is still needed for virtual subclasses, e.g. of abstract base classes. It is not cached here,
+	# since classes may be registered at any time; abstract base classes keep and invalidate their own caches.
+	return _is_mro_subclass_of_any(cls, classes) or issubclass(cls, tuple(classes))
 
 
 def is_calling_class_valid(
-		allowed_classes: Set[type] | None,
+		allowed_classes: FrozenSet[type] | None,
 		from_frame: int = 0
 ) -> Tuple[bool, type | None]:
-	calling_class = None
-	found = False
-	_, cls = next(trace_execution(allowed_classes, skip_frames=from_frame + 2))
-
-	if cls is not None:
-		found = next(
-			(True for c in allowed_classes if issubclass(cls, c)),
-			False
+	# The calling class is the one of the first traced frame; `None` if the caller is not in a class
+	_, calling_class = trace_execution.first(allowed_classes, skip_frames=from_frame + 2)
+	# The calling class itself is usually the permitted one; a single hash probe settles it
+	found = calling_class is not None and (
+		calling_class in allowed_classes or _is_subclass_of_any(calling_class, allowed_classes)
+	)
+	return found, calling_class
+
+
+class DescendentMembers:
+	"""
+	Lists the members of objects that may be their descendents, as (name, value) pairs.
+	The class members are read from the dictionaries of the classes in the MRO on every call,
+	without calling their descriptors, so members that are added to a class later are also listed.
+	"""
+
+	@staticmethod
+	def _get_class_names(cls: type, include_methods: bool) -> Dict[str, None]:
+		"""
+		Returns the names of the class members that, when accessed through an object, may be its descendents.\n
+		:param cls: The class of the object.
+		:param include_methods: Also return the names of methods.
+		:return: The names, as the keys of an ordered dictionary.
+		"""
+		names = dict()
+		visited = set()
+
+		for base in cls.__mro__[:-1]:  # The last one is `object`, whose members are all dunders
+			for name, value in base.__dict__.items():
+				if name.startswith('__') or name in visited:  # Filters dunder and overridden members
+					continue
+
+				visited.add(name)
+
+				if not (
+						isinstance(value, BuiltinFunctionType) or  # Filters build-in members
+						isinstance(value, type) or  # Filters type objects
+						not include_methods and isinstance(value, (FunctionType, staticmethod, classmethod))
+				):
+					names[name] = None
+
+		return names
+
+	def __call__(self, obj: object, include_methods: bool = False) -> Generator[Tuple[str, Any]]:
+		"""
+		Yields the members of `obj` that may be its descendents.\n
+		:param obj: The object to be inspected; not a class.
+		:param include_methods: Also yield the methods.
+		:return: Yields (name, value) pairs.
+		"""
+		class_names = DescendentMembers._get_class_names(type(obj), include_methods)
+		obj_names = (
+			name for name in getattr(obj, '__dict__', ())
+			if not name.startswith('__') and name not in class_names
 		)
 
-		calling_class = cls
+		for name in itertools.chain(class_names, obj_names):
+			try:
+				value = getattr(obj, name)
+			except AttributeError:  # E.g. a missing slot member
+				continue
 
-	return found, calling_class
+			yield name, value
 
 
 def get_descendents(
@@ -246,7 +344,9 @@ def get_descendents(
 		yield obj
 
 		if visit_children is None or visit_children():
-			for name, member in get_members(obj):
+			members = get_members(obj) if isinstance(obj, type) else get_descendent_members(obj, include_methods)
+
+			for name, member in members:
 				if not (
 						name.startswith('__') or  # Filters dunder members
 						isinstance(member, BuiltinFunctionType) or  # Filters build-in members
@@ -361,42 +461,72 @@ class View(object):
 	"""
 	A proxy class of an arbitrary object.
 	"""
+	__slots__ = ('__obj__', '__weakref__')
 	__proxy_cache = dict()
-	__obj__ = None  # Necessary for the class to detect it as a member
+	__member_names_cache: Dict[type, FrozenSet[str] | None] = dict()
 
 	def __init__(self, obj, **kwargs):
 		self.__obj__ = obj
 
+	@staticmethod
+	def __get_member_names(cls: type) -> FrozenSet[str] | None:
+		"""
+		Returns the names of the members of a view class, i.e. the names defined along its MRO, and caches them.
+		Members that are added to the class after the first call are not detected.\n
+		:param cls: The view class.
+		:return: The names; `None` if the instances of the class have a `__dict__`, which may hold any name.
+		"""
+		if cls.__dictoffset__:
+			names = None
+		else:
+			names = frozenset(itertools.chain.from_iterable(c.__dict__ for c in cls.__mro__))
+
+		View.__member_names_cache[cls] = names
+		return names
+
 	def __getattribute__(self, item):
-		try:
-			return object.__getattribute__(self, item)
-		except AttributeError:
-			value = getattr(self.__obj__, item)
-
-			# If the member of obj is a method, we'll pass the proxy to it, instead of obj
-			if isinstance(value, MethodType):
-				value = getattr(type(self.__obj__), item)
-				return value.__get__(self, type(self))
-			# If the member is of one of the following type, return its view()
-			# The view() method of ClassDecorator returns an ObjectView.
-			# This makes recursive proxying possible.
-			elif isinstance(value, ClassWrapperBase):
-				return value.view()
-			else:
-				return value
+		try:  # Inlined cache lookup
+			names = View.__member_names_cache[type(self)]
+		except KeyError:
+			names = View.__get_member_names(type(self))
+
+		# Only try the view itself for its own members; a failed lookup raises an `AttributeError`, which is costly
+		if names is None or item in names:
+			try:
+				return object.__getattribute__(self, item)
+			except AttributeError:  # E.g. an unset slot
+				pass
+		elif item == '__dict__':  # Views have no `__dict__`; the live one of the viewed object must not leak through
+			return object.__getattribute__(self, item)  # Raises the `AttributeError`
+
+		# Read the slot directly; going through `self.__obj__` would re-enter this method
+		obj = object.__getattribute__(self, '__obj__')
+		value = getattr(obj, item)
+
+		# If the member of obj is a method, we'll pass the proxy to it, instead of obj
+		if isinstance(value, MethodType):
+			value = getattr(type(obj), item)
+			return value.__get__(self, type(self))
+		# If the member is of one of the following type, return its view()
+		# The view() method of ClassDecorator returns an ObjectView.
+		# This makes recursive proxying possible.
+		elif isinstance(value, ClassWrapperBase):
+			return value.view()
+		else:
+			return value
 
 	def __setattr__(self, key, value):
-		try:
-			object.__getattribute__(self, key)  # Raises error if key is not in self
+		# The members of a view are declared on its class, e.g. as slots;
+		# an unset slot is still a member, even though reading it raises an error.
+		if hasattr(type(self), key):
 			object.__setattr__(self, key, value)
-		except AttributeError:
+		else:
 			setattr(self.__obj__, key, value)
 
 	def __delattr__(self, item):
-		try:
-			object.__getattribute__(self, item)
+		if hasattr(type(self), item):
 			object.__delattr__(self, item)
-		except AttributeError:
+		else:
 			return delattr(self.__obj__, item)
 
 	@classmethod
@@ -430,6 +560,7 @@ class View(object):
 		# The `__new__` method is called when the proxy is being copied and
 		# it must be `object`'s `__new__`.
 		special_methods[object.__new__.__name__] = object.__new__
+		special_methods['__slots__'] = ()
 		return type(cls.__name__, (cls,), special_methods)
 
 	def __new__(cls, obj, *args, **kwargs):
@@ -492,7 +623,8 @@ class MultiView:
 		methods = {
 			object.__init__.__name__: __init__,
 			object.__new__.__name__: object.__new__,
-			view.__name__: view
+			view.__name__: view,
+			'__slots__': ()
 		}
 		return type(name, classes, methods)
 
@@ -509,8 +641,11 @@ class MultiView:
 
 
 class ClassWrapperBase(Generic[ClassDecoratorDataType]):
+	# No `__slots__` in wrapper bases: a wrapper derives from the decorated class and a wrapper base,
+	# and wrappers derive from other wrappers; slots in more than one of them conflict in layout.
 	__decorator__: ClassDecoratorDataType
 	__cls__: type
+	__view_classes_cache: Dict[type, FrozenSet[Type[View]]] = dict()
 
 	@staticmethod
 	def __is_wrapper(cls: Type[ClassWrapperBase] | type) -> bool:
@@ -535,20 +670,13 @@ class ClassWrapperBase(Generic[ClassDecoratorDataType]):
 		base: Type[ClassWrapperBase] | type = cls.__bases__[1]
 		return base.View
 
-	def __init_subclass__(cls: Type[ClassWrapperBase] | type, **kwargs):
-		if ClassWrapperBase.__is_wrapper(cls):
-			if ClassWrapperBase.__is_wrapper(cls.__bases__[0]):
-				# noinspection PyUnresolvedReferences
-				cls.__cls__ = cls.__bases__[0].__cls__
-			else:
-				cls.__cls__ = cls.__bases__[0]
-
-	def __init__(self, args, kwargs, wrapper_cls: Type[ClassWrapperBase]):
+	@staticmethod
+	def __create_init(wrapper_cls: Type[ClassWrapperBase] | type) -> Callable:
 		"""
-		__init__ super-method to be overridden by ClassWrappers.\n
-		:param args: packed *args of the child __init__
-		:param kwargs: packed **kwargs of the child __init__
-		:param wrapper_cls: The wrapper class whose __init__ has been called
+		Creates the `__init__` of a wrapper. The classes and methods it calls are resolved once, here,
+		instead of on every instantiation.\n
+		:param wrapper_cls: The wrapper.
+		:return: The `__init__` of the wrapper.
 		"""
 
 		# The function to be replaced by object.__init__;
@@ -562,25 +690,57 @@ class ClassWrapperBase(Generic[ClassDecoratorDataType]):
 		parent_cls: Type[ClassWrapperBase] | type = wrapper_cls.__bases__[1]
 		decorated_cls = wrapper_cls.__cls__
 		intended_method = object__init__ if decorated_cls.__init__ == object.__init__ else decorated_cls.__init__
-		intended_kwargs, augmented_kwargs = tailor_arguments(
-			intended_method=intended_method,
-			augmented_method=parent_cls.__load__,
-			ignore_intended_params=1,
-			ignore_augmented_params=1,
-			args=args,
-			kwargs=kwargs
-		)
-		# Call `__init__`'s bottom to top and then call the decorated class's `__init__`!
-		# Call `wrapped_cls.__init__` with kwargs if it is a ClassWrapper; else, with intended_kwargs.
-		parent_cls.__load__(self, **augmented_kwargs)
-		wrapped_cls.__init__(self, *args, **(intended_kwargs if wrapped_cls == decorated_cls else kwargs))
-
-		# if wrapped_cls == decorated_cls:
-		# 	parent_cls.__load__(self, **augmented_kwargs)
-		# 	wrapped_cls.__init__(self, *args, **intended_kwargs)
-		# else:
-		# 	wrapped_cls.__init__(self, *args, **kwargs)
-		# 	parent_cls.__load__(self, **augmented_kwargs)
+		wrapped_init = wrapped_cls.__init__
+		parent_load = parent_cls.__load__
+		is_wrapped_decorated = wrapped_cls == decorated_cls
+
+		def __init__(*args, **kwargs):
+			# The reason why I do not use `self`:
+			# We do not know the name of the `self` argument in `cls.__init__`;
+			# All we know is it will be the first argument, i.e. args[0].
+			# To avoid name conflict between `self` and `**kwargs`, I do not use `self`.
+			if len(args) == 1 and not kwargs:  # Constructed without arguments; there is nothing to tailor
+				obj = args[0]
+				parent_load(obj)
+				wrapped_init(obj)
+				return
+
+			obj, args = args[0], args[1:]
+			intended_kwargs, augmented_kwargs = tailor_arguments(
+				intended_method=intended_method,
+				augmented_method=parent_load,
+				ignore_intended_params=1,
+				ignore_augmented_params=1,
+				args=args,
+				kwargs=kwargs
+			)
+			# Call `__init__`'s bottom to top and then call the decorated class's `__init__`!
+			# Call `wrapped_cls.__init__` with kwargs if it is a ClassWrapper; else, with intended_kwargs.
+			parent_load(obj, **augmented_kwargs)
+			wrapped_init(obj, *args, **(intended_kwargs if is_wrapped_decorated else kwargs))
+
+		return __init__
+
+	def __init_subclass__(cls: Type[ClassWrapperBase] | type, **kwargs):
+		if ClassWrapperBase.__is_wrapper(cls):
+			if ClassWrapperBase.__is_wrapper(cls.__bases__[0]):
+				# noinspection PyUnresolvedReferences
+				cls.__cls__ = cls.__bases__[0].__cls__
+			else:
+				cls.__cls__ = cls.__bases__[0]
+
+			if object.__init__.__name__ not in cls.__dict__:
+				cls.__init__ = ClassWrapperBase.__create_init(cls)
+
+	def __init__(self, args, kwargs, wrapper_cls: Type[ClassWrapperBase]):
+		"""
+		__init__ super-method to be overridden by ClassWrappers.
+		Wrappers that do not define `__init__` are given one by `__init_subclass__`, which does not call this.\n
+		:param args: packed *args of the child __init__
+		:param kwargs: packed **kwargs of the child __init__
+		:param wrapper_cls: The wrapper class whose __init__ has been called
+		"""
+		ClassWrapperBase.__create_init(wrapper_cls)(self, *args, **kwargs)
 
 	def __load__(self, **kwargs):
 		raise NotImplementedError(Errors.MethodNotImplemented.format(self.__load__.__qualname__))
@@ -592,20 +752,23 @@ class ClassWrapperBase(Generic[ClassDecoratorDataType]):
 		:param kwargs:
 		:return:
 		"""
-		view_classes: Set[Type[View]] = set()
-
-		for cls in type(self).mro():
-			if ClassWrapperBase.__is_wrapper(cls):
-				view_cls = ClassWrapperBase.__get_wrapper_view(cls)
-				view_classes.add(view_cls)
+		try:  # The view classes only depend on the class of the object
+			view_classes = ClassWrapperBase.__view_classes_cache[type(self)]
+		except KeyError:
+			view_classes = frozenset(
+				ClassWrapperBase.__get_wrapper_view(cls)
+				for cls in type(self).mro()
+				if ClassWrapperBase.__is_wrapper(cls)
+			)
+			ClassWrapperBase.__view_classes_cache[type(self)] = view_classes
 
-		return MultiView(frozenset(view_classes), self, **kwargs)
+		return MultiView(view_classes, self, **kwargs)
 
 	class View(View):
 		"""
 		The base View class of a decorator.
 		"""
-		pass
+		__slots__ = ()
 
 
 class ClassDecoratorData:
@@ -664,31 +827,37 @@ class MethodDecorator(Generic[ClassDecoratorType, MethodDecoratorType]):
 	_class_decorator: Type[ClassDecoratorType] = None
 	__last_decorator_spec: Optional[MethodSpec[ClassDecoratorType, MethodDecoratorType]] = None
 
-	def __call__(self, method: Callable, wrapper: Callable = None):
-		if wrapper is None:
-			if not isinstance(method, FunctionType):  # Remember that methods are functions before they are bound to classes
-				raise TypeError(Errors.CallWithMethodArg.format(type(self).__name__))
+	def __call__(self, method: Callable, wrapper: Callable) -> Callable:
+		"""
+		Sanitizes and registers the method, and names the wrapper after it.
+		Called once by the child class, with the wrapper it created for the method.
+		:param method: The decorated method.
+		:param wrapper: The wrapper of the method.
+		:return: The wrapper.
+		"""
+		if not isinstance(method, FunctionType):  # Remember that methods are functions before they are bound to classes
+			raise TypeError(Errors.CallWithMethodArg.format(type(self).__name__))
 
-			spec = MethodSpec[ClassDecoratorType, MethodDecoratorType](method, self)
+		spec = MethodSpec[ClassDecoratorType, MethodDecoratorType](method, self)
 
-			if (  # If the previous class has been finalized or we're still on the same class
-					MethodDecorator.__last_decorator_spec is None or  # First time a method is decorated
-					len(current_decorator_specs) == 0 or  # First time a method is decorated on the new class
-					MethodDecorator.__last_decorator_spec.has_same_class(spec)  # We're still on the current class
-			):
-				# Save the last wrapper for comparison to the next one, and store the decorator spec in a dictionary
-				MethodDecorator.__last_decorator_spec = spec
-				current_decorator_specs[spec.class_decorator_type].add(spec)
-			else:
-				raise DecorationUsageError(
-					Errors.ClassNotFinalized.format(
-						MethodDecorator.__last_decorator_spec.decorated_class_qualname,
-						current_decorator_specs[spec.class_decorator_type].pop().class_decorator_name
-					)
-				)
+		if (  # If the previous class has been finalized or we're still on the same class
+				MethodDecorator.__last_decorator_spec is None or  # First time a method is decorated
+				len(current_decorator_specs) == 0 or  # First time a method is decorated on the new class
+				MethodDecorator.__last_decorator_spec.has_same_class(spec)  # We're still on the current class
+		):
+			# Save the last wrapper for comparison to the next one, and store the decorator spec in a dictionary
+			MethodDecorator.__last_decorator_spec = spec
+			current_decorator_specs[spec.class_decorator_type].add(spec)
 		else:
-			wraps(wrapper, method)
-			return wrapper
+			raise DecorationUsageError(
+				Errors.ClassNotFinalized.format(
+					MethodDecorator.__last_decorator_spec.decorated_class_qualname,
+					current_decorator_specs[spec.class_decorator_type].pop().class_decorator_name
+				)
+			)
+
+		wraps(wrapper, method)
+		return wrapper
 
 
 class MethodSpec(Generic[ClassDecoratorType, MethodDecoratorType]):
@@ -792,4 +961,5 @@ current_decorator_specs: DefaultDict[Type, Set[MethodSpec[ClassDecoratorType, Me
 Hold information about the current class that is being decorated. 
 Used to make sure that the process is being done correctly.
 """
-trace_execution = ExecutionTracer()
\ No newline at end of file
+trace_execution = ExecutionTracer()
+get_descendent_members = DescendentMembers()
\ No newline at end of file
@@ -27,9 +27,23 @@ class FrozenError(PermissionError):
 	pass
 
 
+@functools.lru_cache()
+def _error_message(message: str, method_name: str, cls: type) -> str:
+	"""
+	Formats the error message of calling a method on the objects of a class.
+	Cached, since the message only depends on its arguments.\n
+	:param message: The message template, whose arguments are the method name and the class name.
+	:param method_name: The name of the method that was called.
+	:param cls: The class of the object.
+	:return: The error message.
+	"""
+	return message.format(method_name, cls.__qualname__)
+
+
 class Freezable(ClassWrapperBase['FreezableClassDecoratorData']):
 	def __load__(self, frozen: bool = False):
-		self.__frozen__ = frozen
+		# `__frozen__` is always a `bool`; testing the truth of `True` and `False` is the fastest
+		self.__frozen__ = bool(frozen)
 
 		if self.__frozen__:
 			self._set_frozen_state(frozen=True, deep=False)
@@ -40,24 +54,25 @@ class Freezable(ClassWrapperBase['FreezableClassDecoratorData']):
 		:param method: The frozen method that was called.
 		:raises FrozenError: Always raises an error.
 		"""
-		raise FrozenError(
-			Errors.CallingFrozenMethod.format(method.__name__, type(self).__qualname__)
-		)
+		raise FrozenError(_error_message(Errors.CallingFrozenMethod, method.__name__, type(self)))
 
 	def _set_frozen_state(self, frozen: bool, deep: bool) -> None:
 		# Visits only the children of freezable objects. Therefore,
 		# only the directly-accessible frozen members will be frozen/melted.
 		# The underlying rule is every object is responsible for the behavior of its own children.
+		frozen = bool(frozen)
 		self.__frozen__ = frozen
 
 		if deep:
-			is_freezable: bool
-
-			for obj in get_descendents(self, visit_children=lambda: is_freezable):
-				is_freezable = isinstance(obj, Freezable)
+			stack: List[Freezable] = [self]
+			visited: Set[int] = {id(self)}
 
-				if is_freezable:
-					obj.__frozen__ = frozen
+			while stack:
+				for _, member in get_descendent_members(stack.pop()):
+					if isinstance(member, Freezable) and id(member) not in visited:
+						visited.add(id(member))
+						member.__frozen__ = frozen
+						stack.append(member)
 
 	@property
 	def frozen(self) -> bool:
@@ -86,6 +101,7 @@ class Freezable(ClassWrapperBase['FreezableClassDecoratorData']):
 	def copy(self, deep: bool = True, frozen: bool = None):
 		"""
 		Makes of copy of the object, and make the copy frozen or unfrozen.
+		To get a frozen object without copying, use `view()` instead.
 		:param deep: If `True`, the copy will be deep; otherwise, it will be shallow.
 		:param frozen: If `None`, the copy will inherit the object's frozen state;
 		otherwise, its frozen state will be set accordingly.
@@ -93,7 +109,9 @@ class Freezable(ClassWrapperBase['FreezableClassDecoratorData']):
 		"""
 		new_obj = copy.deepcopy(self) if deep else copy.copy(self)
 
-		if frozen is not None:
+		# A shallow copy shares its descendents with this object; only its own state is set,
+		# which the copy already has if it equals `frozen`.
+		if frozen is not None and (deep or new_obj.__frozen__ != frozen):
 			new_obj._set_frozen_state(frozen=frozen, deep=deep)
 
 		return new_obj
@@ -102,7 +120,58 @@ class Freezable(ClassWrapperBase['FreezableClassDecoratorData']):
 		"""
 		The view base class of frozen, which is always frozen.
 		"""
+		__slots__ = ()
 		__frozen__ = True
+		"""
+		Views are always frozen. A class constant, so views hold no state of their own and cannot be melted.
+		"""
+
+		def __frozen_error__(self, method: Callable) -> None:
+			"""
+			Raises the frozen error of the viewed object's class.
+			Defined on the view so that the lookup does not fall back on the view's delegating `__getattribute__`.\n
+			:param method: The frozen method that was called.
+			:raises FrozenError: Always raises an error.
+			"""
+			obj = self.__obj__
+
+			while isinstance(obj, View):  # The viewed object of a view of a view is itself a view
+				obj = obj.__obj__
+
+			type(obj).__frozen_error__(self, method)
+
+
+def _wrapper_methods(let_freeze: bool, let_melt: bool) -> Dict[str, Callable]:
+	"""
+	Makes the `freeze` and `melt` methods of a freezable wrapper.
+	The permissions of the wrapper are bound to the methods, instead of being looked up on every call.\n
+	:param let_freeze: Whether `freeze` can be called.
+	:param let_melt: Whether `melt` can be called.
+	:return: The methods by their names.
+	"""
+	def freeze(self: Freezable, deep: bool = True) -> None:
+		if isinstance(self, View):  # Inlined `locked_in_view`
+			raise PermissionError(_error_message(Errors.ViewMethodNotCallable, freeze.__name__, type(self)))
+		elif let_freeze:
+			return self._set_frozen_state(frozen=True, deep=deep)
+		else:
+			raise PermissionError(_error_message(Errors.MethodNotCallable, freeze.__name__, type(self)))
+
+	def melt(self: Freezable, deep: bool = True) -> None:
+		if isinstance(self, View):  # Inlined `locked_in_view`
+			raise PermissionError(_error_message(Errors.ViewMethodNotCallable, melt.__name__, type(self)))
+		elif let_melt:
+			return self._set_frozen_state(frozen=False, deep=deep)
+		else:
+			raise PermissionError(_error_message(Errors.MethodNotCallable, melt.__name__, type(self)))
+
+	wraps(freeze, Freezable.freeze)
+	wraps(melt, Freezable.melt)
+
+	return {
+		freeze.__name__: freeze,
+		melt.__name__: melt,
+	}
 
 
 class FreezableClassDecorator(ClassDecorator['FreezableClassDecorator', 'FreezableMethodDecorator']):
@@ -122,39 +191,11 @@ class FreezableClassDecorator(ClassDecorator['FreezableClassDecorator', 'Freezab
 		"""
 		super().__call__(cls)
 
-		class FreezableWrapper(cls, Freezable):
-			__decorator__ = FreezableClassDecoratorData(self)
-
-			def __init__(*args, **kwargs):
-				# The reason why I do not use `self`:
-				# We do not know the name of the `self` argument in `cls.__init__`;
-				# All we know is it will be the first argument, i.e. args[0].
-				# To avoid name conflict between `self` and `**kwargs`, I do not use `self`.
-				Freezable.__init__(
-					self=args[0],
-					args=args[1:],
-					kwargs=kwargs,
-					wrapper_cls=FreezableWrapper,
-				)
-
-			@locked_in_view
-			def freeze(self, deep: bool = True) -> None:
-				if FreezableWrapper.__decorator__.let_freeze:
-					return self._set_frozen_state(frozen=True, deep=deep)
-				else:
-					raise PermissionError(
-						Errors.MethodNotCallable.format(FreezableWrapper.freeze.__name__, type(self).__qualname__)
-					)
-
-			@locked_in_view
-			def melt(self, deep: bool = True) -> None:
-				if FreezableWrapper.__decorator__.let_melt:
-					return self._set_frozen_state(frozen=False, deep=deep)
-				else:
-					raise PermissionError(
-						Errors.MethodNotCallable.format(FreezableWrapper.melt.__name__, type(self).__qualname__)
-					)
+		def exec_body(namespace: Dict[str, Any]) -> None:
+			namespace.update(_wrapper_methods(let_freeze=self.let_freeze, let_melt=self.let_melt))
+			namespace['__decorator__'] = FreezableClassDecoratorData(self)
 
+		FreezableWrapper = new_class('FreezableWrapper', (cls, Freezable), exec_body=exec_body)
 		super().__call__(cls, FreezableWrapper)
 		return FreezableWrapper
 
@@ -173,23 +214,23 @@ class FreezableClassDecoratorData(ClassDecoratorData):
 
 class FreezableMethodDecorator(MethodDecorator['FreezableClassDecorator', 'FreezableMethodDecorator']):
 	def __call__(self, method: Callable, *_):
-		super().__call__(method)
-		
 		def freezable_wrapper(*args, **kwargs):
 			obj = args[0]
 
-			if isinstance(obj, Freezable) or isinstance(obj, View):
-				if obj.__frozen__:
-					obj.__frozen_error__(method)
-				else:
-					return method(*args, **kwargs)
-			else:
+			try:  # Only freezable objects and their views have `__frozen__`; no need to check their types
+				frozen = obj.__frozen__
+			except AttributeError:
 				raise DecorationUsageError(
 					Errors.ClassNotFinalized.format(
 						obj.__class__.__qualname__,
 						freezableclass.__name__
 					)
-				)
+				) from None
+
+			if frozen:
+				obj.__frozen_error__(method)
+			else:
+				return method(*args, **kwargs)
 
 		return super().__call__(method, freezable_wrapper)
 
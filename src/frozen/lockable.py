@@ -44,11 +44,72 @@ class LockError(PermissionError):
 	pass
 
 
+@functools.lru_cache()
+def _locked_error_message(method: Callable, key: str) -> str:
+	"""
+	Formats the error message of calling a locked method. Cached, since the message only depends on its arguments.\n
+	:param method: The called method.
+	:param key: The key that the method is locked with.
+	:return: The error message.
+	"""
+	return Errors.CallingLockedMethod.format(method.__qualname__, key)
+
+
+@functools.lru_cache()
+def _permission_error_message(message: str, calling_cls: type | None, cls: type, key: str) -> str:
+	"""
+	Formats the error message of locking or unlocking without permission.
+	Cached, since the message only depends on its arguments.\n
+	:param message: The message template, whose arguments are the calling class, the locked class and the key.
+	:param calling_cls: The class that tried to lock or unlock.
+	:param cls: The class of the locked object.
+	:param key: The key used to lock or unlock.
+	:return: The error message.
+	"""
+	return message.format("NoneType" if calling_cls is None else calling_cls.__qualname__, cls.__qualname__, key)
+
+
+_lock_bits: Dict[str, int] = {}
+"""
+The bits of the lock keys in the lock masks, shared by all lockable classes.
+"""
+
+
+def _lock_bit(key: str) -> int:
+	"""
+	Returns the bit of a lock key. A new key is given the next free bit.\n
+	:param key: The lock key.
+	:return: The bit of the key.
+	"""
+	try:
+		return _lock_bits[key]
+	except KeyError:
+		bit = _lock_bits[key] = 1 << len(_lock_bits)
+		return bit
+
+
+def _authorize(permissions: FrozenSet[type] | None) -> Tuple[bool, type | None]:
+	"""
+	Checks if the class that called `lock` or `unlock` is permitted to use the key.
+	Shared by both methods, and must be called directly by them.\n
+	:param permissions: The permitted classes; `None` permits all classes.
+	:return: Whether the calling class is permitted, and the calling class if it was looked up.
+	"""
+	if permissions is None:
+		return True, None
+	else:
+		# Skips this function, `lock` or `unlock`, and their `locked_in_view` wrapper
+		return is_calling_class_valid(permissions, from_frame=3)
+
+
 class Lockable(ClassWrapperBase['LockableClassDecoratorData']):
-	__locks__: Set[str]
+	__locks__: int
+	"""
+	The locks of the object, as a mask of the bits of its lock keys.
+	"""
 
 	def __load__(self, locks: Iterable[str] = None) -> None:
-		self.__locks__ = set()
+		self.__locks__ = 0
 
 		if locks is not None and locks:
 			for key in locks:
@@ -87,7 +148,7 @@ class Lockable(ClassWrapperBase['LockableClassDecoratorData']):
 		:param method: The called method.
 		:return:
 		"""
-		raise LockedError(Errors.CallingLockedMethod.format(method.__qualname__, key))
+		raise LockedError(_locked_error_message(method, key))
 
 	def __lock_error__(self, key: str, calling_cls: type) -> None:
 		"""
@@ -96,9 +157,7 @@ class Lockable(ClassWrapperBase['LockableClassDecoratorData']):
 		:param calling_cls:
 		:return:
 		"""
-		raise LockError(Errors.LockingNotAllowed.format(
-			"NoneType" if calling_cls is None else calling_cls.__qualname__, type(self).__qualname__, key
-		))
+		raise LockError(_permission_error_message(Errors.LockingNotAllowed, calling_cls, type(self), key))
 
 	def __unlock_error__(self, key: str, calling_cls: type) -> None:
 		"""
@@ -107,9 +166,7 @@ class Lockable(ClassWrapperBase['LockableClassDecoratorData']):
 		:param calling_cls:
 		:return: None
 		"""
-		raise UnlockError(Errors.UnlockingNotAllowed.format(
-			"NoneType" if calling_cls is None else calling_cls.__qualname__, type(self).__qualname__, key
-		))
+		raise UnlockError(_permission_error_message(Errors.UnlockingNotAllowed, calling_cls, type(self), key))
 
 	def __lock_key_error__(self, key: str):
 		"""
@@ -120,15 +177,17 @@ class Lockable(ClassWrapperBase['LockableClassDecoratorData']):
 		raise KeyError(Errors.UnrecognizedKey.format(key))
 
 	class View(View):
-		__view_locks__: set = None
+		__slots__ = ('__view_locks__',)
+		__view_locks__: int
 
 		def __init__(self, obj: Lockable):
 			# Takes a snapshot of the current locks
-			self.__view_locks__ = obj.__locks__.copy()
+			self.__view_locks__ = obj.__locks__
 
 		@property
-		def __locks__(self):
-			return self.__view_locks__ | self._View__obj.__locks__
+		def __locks__(self) -> int:
+			# Reads the slots directly, instead of through the delegating `View.__getattribute__`
+			return object.__getattribute__(self, '__view_locks__') | object.__getattribute__(self, '__obj__').__locks__
 
 
 class LockableClassDecorator(ClassDecorator['LockableClassDecorator', 'LockableMethodDecorator']):
@@ -147,119 +206,119 @@ class LockableClassDecorator(ClassDecorator['LockableClassDecorator', 'LockableM
 		elif isinstance(lock_permissions, dict):
 			lock_permissions = lock_permissions.items()
 
-		locks = set(k for k, v in lock_permissions)
+		locks = {k for k, _ in lock_permissions}
 
 		lock_permissions = dict(
-			(k, {v} if isinstance(v, type) else set(v))
+			(k, frozenset({v} if isinstance(v, type) else v))
 			for k, v in lock_permissions if v is not None
 		)
 
 		if unlock_permissions is None:
+			# The same dictionary; `LockableClassDecoratorData` recognizes it and does not rebuild it
 			unlock_permissions = lock_permissions
 		else:
 			if isinstance(unlock_permissions, dict):
 				unlock_permissions = unlock_permissions.items()
 
-			locks.update(k for k, v in unlock_permissions)
+			locks.update(k for k, _ in unlock_permissions)
 
 			unlock_permissions = dict(
-				(k, {v} if isinstance(v, type) else set(v))
+				(k, frozenset({v} if isinstance(v, type) else v))
 				for k, v in unlock_permissions if v is not None
 			)
 
-		self.locks: Set[str] = locks
-		self.lock_permissions: DefaultDict[str, Optional[Set[type]]] = defaultdict(lambda: None, lock_permissions)
-		self.unlock_permissions: DefaultDict[str, Optional[Set[type]]] = defaultdict(lambda: None, unlock_permissions)
+		self.locks: FrozenSet[str] = frozenset(locks)
+		self.lock_permissions: Dict[str, FrozenSet[type]] = lock_permissions
+		self.unlock_permissions: Dict[str, FrozenSet[type]] = unlock_permissions
+		self.wrappers: WeakValueDictionary[type, Type[Lockable]] = WeakValueDictionary()
+		"""
+		The wrappers made by this decorator, by their decorated classes.
+		A class that is decorated again gets the same wrapper, which is kept only as long as it is alive.
+		"""
 
 	def __call__(self, cls, *_):
 		super().__call__(cls)
 
+		try:  # The wrapper has already been named after `cls`; naming it again would overwrite its `__realname__`
+			wrapper = self.wrappers[cls]
+		except KeyError:
+			pass
+		else:
+			current_decorator_specs.pop(type(self), None)
+			return wrapper
+
+		data = LockableClassDecoratorData(self, cls)
+		# Bound once, instead of being looked up through `LockableWrapper.__decorator__` on every call
+		get_lock_bit = data.lock_bits.get
+		get_lock_permissions = data.lock_permissions.get
+		get_unlock_permissions = data.unlock_permissions.get
+
 		class LockableWrapper(cls, Lockable):
-			__decorator__ = LockableClassDecoratorData(self, cls)
-
-			def __init__(*args, **kwargs):
-				# The reason why I do not use `self`:
-				# We do not know the name of the `self` argument in `cls.__init__`;
-				# All we know is it will be the first argument, i.e. args[0].
-				# To avoid name conflict between `self` and `**kwargs`, I do not use `self`.
-				Lockable.__init__(
-					self=args[0],
-					args=args[1:],
-					kwargs=kwargs,
-					wrapper_cls=LockableWrapper,
-				)
+			__decorator__ = data
 
 			@locked_in_view
 			def lock(self, key: str) -> None:
-				if key in LockableWrapper.__decorator__.locks:
-					if LockableWrapper.__decorator__.lock_permissions[key] is None:
-						self.__locks__.add(key)
+				bit = get_lock_bit(key)
+
+				if bit is not None:
+					found, calling_class = _authorize(get_lock_permissions(key))
+
+					if found:
+						self.__locks__ |= bit
 					else:
-						found, calling_class = is_calling_class_valid(
-							LockableWrapper.__decorator__.lock_permissions[key],
-							from_frame=2
-						)
-
-						if found:
-							self.__locks__.add(key)
-						if not found:
-							self.__lock_error__(key, calling_class)
+						self.__lock_error__(key, calling_class)
 				else:
 					self.__lock_key_error__(key)
 
 			@locked_in_view
 			def unlock(self, key: str) -> None:
-				if key in LockableWrapper.__decorator__.locks:
-					if LockableWrapper.__decorator__.unlock_permissions[key] is None:
-						self.__locks__.remove(key)
+				bit = get_lock_bit(key)
+
+				if bit is not None:
+					found, calling_class = _authorize(get_unlock_permissions(key))
+
+					if found:
+						self.__locks__ &= ~bit
 					else:
-						found, calling_class = is_calling_class_valid(
-							LockableWrapper.__decorator__.unlock_permissions[key],
-							from_frame=2
-						)
-
-						if found:
-							try:
-								self.__locks__.remove(key)
-							except KeyError:
-								pass
-						else:
-							self.__unlock_error__(key, calling_class)
+						self.__unlock_error__(key, calling_class)
 				else:
 					self.__lock_key_error__(key)
 
 			def locked(self, key: str) -> bool:
-				if key in LockableWrapper.__decorator__.locks:
-					return key in self.__locks__
+				bit = get_lock_bit(key)
+
+				if bit is not None:
+					return bool(self.__locks__ & bit)
 				else:
 					self.__lock_key_error__(key)
 
+		self.wrappers[cls] = LockableWrapper
 		super().__call__(cls, LockableWrapper)
 		return LockableWrapper
 
 
 class LockableClassDecoratorData(ClassDecoratorData):
-	locks: Set[str]
-	lock_permissions: DefaultDict[str, Optional[Set[type]]]
-	unlock_permissions: DefaultDict[str, Optional[Set[type]]]
+	locks: FrozenSet[str]
+	lock_permissions: Dict[str, FrozenSet[type]]
+	unlock_permissions: Dict[str, FrozenSet[type]]
+	lock_bits: Dict[str, int]
 
 	def __init__(
 			self,
 			decorator: LockableClassDecorator,
 			cls: type
 	):
-		self.locks = decorator.locks
-		self.lock_permissions = decorator.lock_permissions
-		self.unlock_permissions = decorator.unlock_permissions
-
-		for spec in decorator.method_specs:
-			self.locks.update(spec.method_decorator.keys)
+		locks = set(decorator.locks)
+		# Each wrapper has its own immutable permission sets, so that the permission checks can be cached
+		self.lock_permissions = {lock: cls_set | {cls} for lock, cls_set in decorator.lock_permissions.items()}
 
-		for lock in self.lock_permissions:
-			self.lock_permissions[lock].add(cls)
+		if decorator.unlock_permissions is decorator.lock_permissions:
+			self.unlock_permissions = self.lock_permissions.copy()
+		else:
+			self.unlock_permissions = {lock: cls_set | {cls} for lock, cls_set in decorator.unlock_permissions.items()}
 
-		for lock in self.unlock_permissions:
-			self.unlock_permissions[lock].add(cls)
+		for spec in decorator.method_specs:
+			locks.update(spec.method_decorator.keys)
 
 		if issubclass(cls, Lockable):
 			wrapper = LockableClassDecorator.get_wrapper_class(cls)
@@ -272,7 +331,11 @@ class LockableClassDecoratorData(ClassDecoratorData):
 				if lock not in self.unlock_permissions:
 					self.unlock_permissions[lock] = cls_set
 
-			self.locks.update(wrapper.__decorator__.locks)
+			locks.update(wrapper.__decorator__.locks)
+
+		# Nothing is added after the wrapper is created
+		self.locks = frozenset(locks)
+		self.lock_bits = {lock: _lock_bit(lock) for lock in self.locks}
 
 
 class LockableMethodDecorator(MethodDecorator['LockableClassDecorator', 'LockableMethodDecorator']):
@@ -283,25 +346,29 @@ class LockableMethodDecorator(MethodDecorator['LockableClassDecorator', 'Lockabl
 			raise ValueError(Errors.NoKeysDefined.format(self._decorator_function.__name__))
 
 	def __call__(self, method: Callable, *_):
-		super().__call__(method)
+		bit_keys = {_lock_bit(key): key for key in self.keys}  # The method's keys, by their lock bits
+		method_mask = 0
+
+		for bit in bit_keys:
+			method_mask |= bit
 
 		def lockable_wrapper(*args, **kwargs):
 			obj = args[0]
 
-			if isinstance(obj, Lockable) or isinstance(obj, View):
-				keys = self.keys.intersection(obj.__locks__)
-
-				if keys:
-					obj.__locked_error__(next(iter(keys)), method)
-				else:
-					return method(*args, **kwargs)
-			else:
+			try:  # Only lockable objects and their views have `__locks__`; no need to check their types
+				locks = obj.__locks__ & method_mask
+			except AttributeError:
 				raise DecorationUsageError(
 					Errors.ClassNotFinalized.format(
 						obj.__class__.__qualname__,
 						lockableclass.__name__
 					)
-				)
+				) from None
+
+			if not locks:  # The common case first: none of the method's keys are locked
+				return method(*args, **kwargs)
+			else:
+				obj.__locked_error__(bit_keys[locks & -locks], method)  # The key of the lowest locked bit
 
 		return super().__call__(method, lockable_wrapper)
 
@@ -338,7 +405,21 @@ class ModuleElements(ModuleElements):
 
 	@staticmethod
 	def method(keys: Iterable[str] = None) -> LockableMethodDecorator:
-		return LockableMethodDecorator(keys=keys)
+		if keys is not None:
+			return _lockable_method_decorator(frozenset(keys))
+		else:
+			return LockableMethodDecorator(keys=keys)
+
+
+@functools.lru_cache()
+def _lockable_method_decorator(keys: FrozenSet[str]) -> LockableMethodDecorator:
+	"""
+	Returns the method decorator of a set of keys. Cached, since the decorator holds nothing but its keys;
+	methods that are decorated with the same keys share a decorator.\n
+	:param keys: The keys of the decorator.
+	:return: The method decorator.
+	"""
+	return LockableMethodDecorator(keys=keys)
 
 
 LockableClassDecorator._decorator_function = lockableclass